@@ -4,27 +4,34 @@ if (-NOT ([Security.Principal.WindowsPrincipal][Security.Principal.WindowsIdenti
     Break
 }
 
-# Enable IPv6 on all network adapters
-Get-NetAdapter | ForEach-Object {
-    Enable-NetAdapterBinding -Name $_.Name -ComponentID ms_tcpip6
+# Enumerate network adapters once and reuse the list below
+$adapters = @(Get-NetAdapter)
+
+# Enable IPv6 on all network adapters in a single call
+if ($adapters.Count -gt 0) {
+    Enable-NetAdapterBinding -Name $adapters.Name -ComponentID ms_tcpip6
 }
 
-# Reset DNS servers to DHCP for all network adapters
-Get-NetAdapter | Where-Object {$_.Status -eq "Up"} | ForEach-Object {
-    Set-DnsClientServerAddress -InterfaceIndex $_.ifIndex -ResetServerAddresses
+# Reset DNS servers to DHCP for all network adapters in a single call
+$upAdapters = @($adapters | Where-Object {$_.Status -eq "Up"})
+if ($upAdapters.Count -gt 0) {
+    Set-DnsClientServerAddress -InterfaceIndex $upAdapters.ifIndex -ResetServerAddresses
 }
 
-# Enable DNS over HTTPS (restore to default)
-Remove-ItemProperty -Path "HKLM:\SYSTEM\CurrentControlSet\Services\Dnscache\Parameters" -Name "EnableAutoDOH" -ErrorAction SilentlyContinue
+# Open the DNS Client parameters key once for both settings
+$dnsCacheKey = [Microsoft.Win32.Registry]::LocalMachine.OpenSubKey("SYSTEM\CurrentControlSet\Services\Dnscache\Parameters", $true)
+try {
+    # Enable DNS over HTTPS (restore to default)
+    $dnsCacheKey.DeleteValue("EnableAutoDOH", $false)
 
-# Reset Random Name Resolution (restore to default)
-Remove-ItemProperty -Path "HKLM:\SYSTEM\CurrentControlSet\Services\Dnscache\Parameters" -Name "QueryIpMatching" -ErrorAction SilentlyContinue
+    # Reset Random Name Resolution (restore to default)
+    $dnsCacheKey.DeleteValue("QueryIpMatching", $false)
+} finally {
+    $dnsCacheKey.Close()
+}
 
 # Clear DNS cache
-ipconfig /flushdns
-
-# Restart DNS Client service
-Restart-Service -Name Dnscache -Force
+Clear-DnsClientCache
 
 Write-Host "DNS settings have been restored to default configuration!" -ForegroundColor Green
 Write-Host "Please restart your computer to ensure all changes take effect." -ForegroundColor Yellow
@@ -2,7 +2,7 @@
 :: Check for admin privileges and self-elevate if needed
 net session >nul 2>&1
 if %errorLevel% neq 0 (
-    powershell -Command "Start-Process '%~f0' -Verb RunAs"
+    powershell -NoProfile -Command "Start-Process '%~f0' -Verb RunAs"
     exit /b
 )
 
@@ -28,27 +28,27 @@ echo.
 set /p choice="Enter your choice (1-6): "
 
 if "%choice%"=="1" (
-    powershell -ExecutionPolicy Bypass -File "%~dp0set-dns-servers.ps1"
+    powershell -NoProfile -ExecutionPolicy Bypass -File "%~dp0set-dns-servers.ps1"
     pause
     goto menu
 )
 if "%choice%"=="2" (
-    powershell -ExecutionPolicy Bypass -File "%~dp0verify-dns.ps1"
+    powershell -NoProfile -ExecutionPolicy Bypass -File "%~dp0verify-dns.ps1"
     pause
     goto menu
 )
 if "%choice%"=="3" (
-    powershell -ExecutionPolicy Bypass -File "%~dp0restore-dns-settings.ps1"
+    powershell -NoProfile -ExecutionPolicy Bypass -File "%~dp0restore-dns-settings.ps1"
     pause
     goto menu
 )
 if "%choice%"=="4" (
-    powershell -ExecutionPolicy Bypass -File "%~dp0test-dns-servers.ps1"
+    powershell -NoProfile -ExecutionPolicy Bypass -File "%~dp0test-dns-servers.ps1"
     pause
     goto menu
 )
 if "%choice%"=="5" (
-    powershell -ExecutionPolicy Bypass -File "%~dp0start-dns-gui.ps1"
+    powershell -NoProfile -ExecutionPolicy Bypass -File "%~dp0start-dns-gui.ps1"
     goto menu
 )
 if "%choice%"=="6" (
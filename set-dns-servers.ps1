@@ -6,18 +6,35 @@ if (-NOT ([Security.Principal.WindowsPrincipal][Security.Principal.WindowsIdenti
 
 # Read DNS Servers from configuration file
 $configPath = Join-Path $PSScriptRoot "dnsConf.txt"
-$dnsServers = @()
+$dnsServers = New-Object System.Collections.Generic.List[string]
+
+# "Name=IP" line capturing the trimmed value; comment lines (even indented) never match (built once, reused per line)
+$configLineRegex = [regex]'^(?!\s*#)\s*[^=]+?\s*=\s*(\S+)\s*$'
+
+# Dotted-quad IPv4 address, each octet limited to 0-255 (built once, reused per line)
+$ipv4Regex = [regex]'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
 
 if (Test-Path $configPath) {
-    # Read all DNS servers without filtering
-    Get-Content $configPath | ForEach-Object {
-        if ($_ -match "(.+)=(.+)") {
-            $dnsServers += $matches[2]  # Just add the IP address
+    # Read DNS servers line by line, skipping entries that are not valid IPv4 addresses
+    $reader = New-Object System.IO.StreamReader($configPath)
+    try {
+        while ($null -ne ($line = $reader.ReadLine())) {
+            $match = $configLineRegex.Match($line)
+            if ($match.Success) {
+                $ip = $match.Groups[1].Value
+                if ($ipv4Regex.IsMatch($ip)) {
+                    $dnsServers.Add($ip)  # Just add the IP address
+
+                    # Limit to first 3 servers for better performance
+                    if ($dnsServers.Count -eq 3) { break }
+                } else {
+                    Write-Warning "Skipping invalid DNS entry: $line"
+                }
+            }
         }
+    } finally {
+        $reader.Dispose()
     }
-
-    # Limit to first 3 servers for better performance
-    $dnsServers = $dnsServers | Select-Object -First 3
 } else {
     Write-Host "Configuration file not found: $configPath" -ForegroundColor Red
     exit 1
@@ -28,24 +45,34 @@ if ($dnsServers.Count -eq 0) {
     exit 1
 }
 
-# Disable IPv6 on all network adapters
-Get-NetAdapter | ForEach-Object {
-    Disable-NetAdapterBinding -Name $_.Name -ComponentID ms_tcpip6
+# Enumerate network adapters once and reuse the list below
+$adapters = @(Get-NetAdapter)
+
+# Disable IPv6 on all network adapters in a single call
+if ($adapters.Count -gt 0) {
+    Disable-NetAdapterBinding -Name $adapters.Name -ComponentID ms_tcpip6
 }
 
-# Set DNS servers for all network adapters
-Get-NetAdapter | Where-Object {$_.Status -eq "Up"} | ForEach-Object {
-    Set-DnsClientServerAddress -InterfaceIndex $_.ifIndex -ServerAddresses $dnsServers
+# Set DNS servers for all network adapters in a single call
+$upAdapters = @($adapters | Where-Object {$_.Status -eq "Up"})
+if ($upAdapters.Count -gt 0) {
+    Set-DnsClientServerAddress -InterfaceIndex $upAdapters.ifIndex -ServerAddresses $dnsServers
 }
 
-# Disable DNS over HTTPS
-Set-ItemProperty -Path "HKLM:\SYSTEM\CurrentControlSet\Services\Dnscache\Parameters" -Name "EnableAutoDOH" -Value 0
+# Open the DNS Client parameters key once for both settings
+$dnsCacheKey = [Microsoft.Win32.Registry]::LocalMachine.OpenSubKey("SYSTEM\CurrentControlSet\Services\Dnscache\Parameters", $true)
+try {
+    # Disable DNS over HTTPS
+    $dnsCacheKey.SetValue("EnableAutoDOH", 0, [Microsoft.Win32.RegistryValueKind]::DWord)
 
-# Disable Random Name Resolution
-Set-ItemProperty -Path "HKLM:\SYSTEM\CurrentControlSet\Services\Dnscache\Parameters" -Name "QueryIpMatching" -Value 0
+    # Disable Random Name Resolution
+    $dnsCacheKey.SetValue("QueryIpMatching", 0, [Microsoft.Win32.RegistryValueKind]::DWord)
+} finally {
+    $dnsCacheKey.Close()
+}
 
 # Clear DNS cache
-ipconfig /flushdns
+Clear-DnsClientCache
 
 Write-Host "DNS configuration completed successfully!"
 Write-Host "Please test your connection and DNS settings."
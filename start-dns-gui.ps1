@@ -4,15 +4,35 @@ if (-NOT ([Security.Principal.WindowsPrincipal][Security.Principal.WindowsIdenti
     Break
 }
 
-# Install HttpListener if not already available
-if (-not (Get-Module -ListAvailable -Name HttpListener)) {
-    Install-Module -Name HttpListener -Force -Scope CurrentUser
-}
-
 $port = 8080
 $url = "http://localhost:$port/"
 $htmlPath = Join-Path $PSScriptRoot "dns-gui.html"
 
+# The page does not change while the server runs, so load it once.
+# The file is already UTF-8 on disk, so its bytes are served as-is.
+$htmlBuffer = [System.IO.File]::ReadAllBytes($htmlPath)
+
+# "Name=IP" lines in dnsConf.txt, matched across the whole file in one pass;
+# comment lines, even indented ones, are ignored (built once, reused per request)
+$configLineRegex = New-Object System.Text.RegularExpressions.Regex(
+    '^(?![ \t]*#)[ \t]*([^=\r\n]+?)[ \t]*=[ \t]*(\S+)[ \t]*\r?$',
+    [System.Text.RegularExpressions.RegexOptions]::Multiline)
+
+# Shared encoder for all JSON responses
+$utf8 = [System.Text.Encoding]::UTF8
+
+# Write a response body with the given content type
+function Send-Response($response, [byte[]]$buffer, [string]$contentType) {
+    $response.ContentType = $contentType
+    $response.ContentLength64 = $buffer.Length
+    $response.OutputStream.Write($buffer, 0, $buffer.Length)
+}
+
+# Encode a JSON string as UTF-8 and write it as the response body
+function Send-JsonResponse($response, [string]$json) {
+    Send-Response $response ($utf8.GetBytes($json)) "application/json"
+}
+
 # Create HTTP Server
 $listener = New-Object System.Net.HttpListener
 $listener.Prefixes.Add($url)
@@ -30,7 +50,7 @@ try {
         if ($request.HttpMethod -eq 'GET') {
             if ($request.Url.LocalPath -eq '/current-dns') {
                 $allDNSServers = Get-DnsClientServerAddress -AddressFamily IPv4 | 
-                    Where-Object {$_.AddressFamily -eq 2 -and $_.ServerAddresses} |
+                    Where-Object {$_.ServerAddresses} |
                     Select-Object -ExpandProperty ServerAddresses
 
                 # Get all unique DNS servers across all interfaces
@@ -41,97 +61,88 @@ try {
                 
                 $jsonResponse = @{
                     dns = $dnsArray
-                } | ConvertTo-Json
+                } | ConvertTo-Json -Compress
                 
-                $buffer = [System.Text.Encoding]::UTF8.GetBytes($jsonResponse)
-                $response.ContentType = "application/json"
-                $response.ContentLength64 = $buffer.Length
-                $response.OutputStream.Write($buffer, 0, $buffer.Length)
+                Send-JsonResponse $response $jsonResponse
             }
             elseif ($request.Url.LocalPath -eq '/dns-config') {
                 $configPath = Join-Path $PSScriptRoot "dnsConf.txt"
                 $dnsServers = @()
                 
                 if (Test-Path $configPath) {
-                    Get-Content $configPath | ForEach-Object {
-                        if ($_ -match "(.+)=(.+)") {
-                            $dnsServers += @{
-                                name = $matches[1]
-                                ip = $matches[2]
-                            }
+                    $config = [System.IO.File]::ReadAllText($configPath)
+                    $dnsServers = @(foreach ($match in $configLineRegex.Matches($config)) {
+                        @{
+                            name = $match.Groups[1].Value
+                            ip = $match.Groups[2].Value
                         }
-                    }
+                    })
                 }
                 
-                $jsonResponse = $dnsServers | ConvertTo-Json
-                $buffer = [System.Text.Encoding]::UTF8.GetBytes($jsonResponse)
-                $response.ContentType = "application/json"
-                $response.ContentLength64 = $buffer.Length
-                $response.OutputStream.Write($buffer, 0, $buffer.Length)
+                $jsonResponse = ConvertTo-Json -InputObject $dnsServers -Compress
+                Send-JsonResponse $response $jsonResponse
             } else {
-                $html = [System.IO.File]::ReadAllText($htmlPath, [System.Text.Encoding]::UTF8)
-                $buffer = [System.Text.Encoding]::UTF8.GetBytes($html)
-                $response.ContentType = "text/html; charset=utf-8"
-                $response.ContentLength64 = $buffer.Length
-                $response.OutputStream.Write($buffer, 0, $buffer.Length)
+                Send-Response $response $htmlBuffer "text/html; charset=utf-8"
             }
         }
         elseif ($request.HttpMethod -eq 'POST' -and $request.Url.LocalPath -eq '/set-dns') {
-            $reader = New-Object System.IO.StreamReader($request.InputStream)
-            $body = $reader.ReadToEnd()
+            # JSON is UTF-8; the page sends no charset, so ContentEncoding would fall back to ANSI
+            $reader = New-Object System.IO.StreamReader($request.InputStream, [System.Text.Encoding]::UTF8)
+            try {
+                $body = $reader.ReadToEnd()
+            } finally {
+                $reader.Dispose()
+            }
             $dnsServers = ($body | ConvertFrom-Json).dns
 
             try {
-                Get-NetAdapter | Where-Object {$_.Status -eq "Up"} | ForEach-Object {
-                    Set-DnsClientServerAddress -InterfaceIndex $_.ifIndex -ServerAddresses $dnsServers
+                $upAdapters = @(Get-NetAdapter | Where-Object {$_.Status -eq "Up"})
+                if ($upAdapters.Count -gt 0) {
+                    Set-DnsClientServerAddress -InterfaceIndex $upAdapters.ifIndex -ServerAddresses $dnsServers
                 }
                 
-                ipconfig /flushdns
+                Clear-DnsClientCache
                 
                 $jsonResponse = @{
                     success = $true
                     message = "DNS settings updated successfully!"
-                } | ConvertTo-Json
+                } | ConvertTo-Json -Compress
                 
             } catch {
                 $jsonResponse = @{
                     success = $false
                     message = "Error: $($_.Exception.Message)"
-                } | ConvertTo-Json
+                } | ConvertTo-Json -Compress
             }
 
-            $buffer = [System.Text.Encoding]::UTF8.GetBytes($jsonResponse)
-            $response.ContentType = "application/json"
-            $response.ContentLength64 = $buffer.Length
-            $response.OutputStream.Write($buffer, 0, $buffer.Length)
+            Send-JsonResponse $response $jsonResponse
         }
         elseif ($request.HttpMethod -eq 'POST' -and $request.Url.LocalPath -eq '/restore-dns') {
             try {
-                Get-NetAdapter | ForEach-Object {
-                    Enable-NetAdapterBinding -Name $_.Name -ComponentID ms_tcpip6
+                $adapters = @(Get-NetAdapter)
+                if ($adapters.Count -gt 0) {
+                    Enable-NetAdapterBinding -Name $adapters.Name -ComponentID ms_tcpip6
                 }
-                Get-NetAdapter | Where-Object {$_.Status -eq "Up"} | ForEach-Object {
-                    Set-DnsClientServerAddress -InterfaceIndex $_.ifIndex -ResetServerAddresses
+                $upAdapters = @($adapters | Where-Object {$_.Status -eq "Up"})
+                if ($upAdapters.Count -gt 0) {
+                    Set-DnsClientServerAddress -InterfaceIndex $upAdapters.ifIndex -ResetServerAddresses
                 }
                 Remove-ItemProperty -Path "HKLM:\SYSTEM\CurrentControlSet\Services\Dnscache\Parameters" -Name "EnableAutoDOH" -ErrorAction SilentlyContinue
-                ipconfig /flushdns
+                Clear-DnsClientCache
                 
                 $jsonResponse = @{
                     success = $true
                     message = "DNS settings have been restored to default configuration!"
-                } | ConvertTo-Json
+                } | ConvertTo-Json -Compress
                 
             } catch {
                 $jsonResponse = @{
                     success = $false
                     message = "Error: $($_.Exception.Message)"
-                } | ConvertTo-Json
+                } | ConvertTo-Json -Compress
             }
 
-            $buffer = [System.Text.Encoding]::UTF8.GetBytes($jsonResponse)
-            $response.ContentType = "application/json"
-            $response.ContentLength64 = $buffer.Length
-            $response.OutputStream.Write($buffer, 0, $buffer.Length)
+            Send-JsonResponse $response $jsonResponse
         }
 
         $response.Close()